@@ -9,9 +9,13 @@ Environment variables (all optional):
 - HERMES_SESSIONS_DIR (default: <HERMES_HOME>/sessions)
 - HERMES_CONVERSATIONS_DIR (default: <HERMES_WORKSPACE>/conversations)
 - HERMES_CONVERSATION_STATE_FILE (default: <HERMES_CONVERSATIONS_DIR>/.state.json)
+  Offset updates are appended to a sibling .journal file and folded back into
+  the state file on startup, shutdown, and once the journal exceeds 64 KiB.
 - HERMES_MAIN_SESSION_ID (fallback session UUID, optional)
 - HERMES_TIMEZONE (default: system local timezone)
-- HERMES_LOGGER_POLL_SECONDS (default: 1)
+- HERMES_LOGGER_POLL_SECONDS (default: 1, used when kqueue is unavailable)
+- HERMES_LOGGER_WATCH_MODE (default: auto; "poll" disables kqueue watching)
+- HERMES_LOGGER_WATCH_TIMEOUT_SECONDS (default: 60, max wait between rechecks)
 - HERMES_LOGGER_MAX_MESSAGE_LENGTH (default: 2000)
 
 Legacy fallbacks (OPENCLAW_*) still work but are deprecated.
@@ -19,12 +23,15 @@ Legacy fallbacks (OPENCLAW_*) still work but are deprecated.
 
 import json
 import os
+import re
+import select
 import sys
 import time
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
 from pathlib import Path
 from zoneinfo import ZoneInfo
-from typing import Optional
+from typing import BinaryIO, Optional
 
 
 def resolve_path(value: str) -> Path:
@@ -75,10 +82,24 @@ WORKSPACE_DIR = resolve_path(env("OPENCLAW_WORKSPACE", str(HOME_DIR / "workspace
 SESSIONS_DIR = resolve_path(env("OPENCLAW_SESSIONS_DIR", str(HOME_DIR / "sessions")))
 CONVERSATIONS_DIR = resolve_path(env("OPENCLAW_CONVERSATIONS_DIR", str(WORKSPACE_DIR / "conversations")))
 STATE_FILE = resolve_path(env("OPENCLAW_CONVERSATION_STATE_FILE", str(CONVERSATIONS_DIR / ".state.json")))
+STATE_JOURNAL_FILE = STATE_FILE.with_suffix(".journal")
+STATE_JOURNAL_MAX_BYTES = 64 * 1024
+READ_BUFFER_SIZE = 128 * 1024
 MAIN_SESSION_ID = env("OPENCLAW_MAIN_SESSION_ID", "").strip()
 LOCAL_TZ = load_timezone()
 MAX_MESSAGE_LENGTH = env_int("OPENCLAW_LOGGER_MAX_MESSAGE_LENGTH", 2000)
 POLL_INTERVAL_SECONDS = env_float("OPENCLAW_LOGGER_POLL_SECONDS", 1)
+WATCH_MODE = env("OPENCLAW_LOGGER_WATCH_MODE", "auto").lower()
+WATCH_TIMEOUT_SECONDS = env_float("OPENCLAW_LOGGER_WATCH_TIMEOUT_SECONDS", 60)
+
+# Shared JSON codecs. JSONEncoder.encode uses the C encoder, unlike json.dump
+# (which streams through the pure-Python one) and json.dumps with custom
+# separators (which builds a new encoder per call).
+JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+JSON_DECODER = json.JSONDecoder()
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11 on
+ISO_Z_SUPPORTED = sys.version_info >= (3, 11)
 
 # Patterns to skip
 SKIP_PATTERNS = [
@@ -90,29 +111,95 @@ SKIP_PATTERNS = [
     "NO_REPLY",
     "HEARTBEAT_OK",
 ]
+SKIP_RE = re.compile("|".join(re.escape(pattern) for pattern in SKIP_PATTERNS))
+
+# Cheap bytes-level checks run before parsing a JSONL line
+MESSAGE_TYPE_RE = re.compile(rb'"type"\s*:\s*"message"')
+MESSAGE_ROLE_RE = re.compile(rb'"role"\s*:\s*"(?:user|assistant)"')
+
+# Last parsed sessions.json, keyed by its mtime and size
+_sessions_cache = {"mtime_ns": 0, "size": -1, "session_id": None}
+
+# Newest session file found by scanning SESSIONS_DIR, keyed by the dir's mtime
+_latest_session_cache = {"dir_mtime_ns": None, "path": None}
+
+# Daily log paths by date, and whether CONVERSATIONS_DIR has been created
+_daily_target_cache: dict[date, Path] = {}
+_newline_checked_targets: set[Path] = set()
+_conversations_dir_ready = False
+
+# Read buffer reused by every process_file pass; grows for one pass if a line
+# outgrows it
+_read_buf = bytearray(READ_BUFFER_SIZE)
 
 
 def load_state() -> dict:
-    """Load the processing state from disk."""
+    """Load the processing state from disk, replaying any journaled updates."""
+    state = {"files": {}}
     if STATE_FILE.exists():
         try:
             with open(STATE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+                state = JSON_DECODER.decode(f.read())
         except (json.JSONDecodeError, IOError) as e:
             print(f"[daemon] Warning: Could not load state: {e}", file=sys.stderr)
-    return {"files": {}}
+    files = state.setdefault("files", {})
+
+    try:
+        with open(STATE_JOURNAL_FILE, "rb") as f:
+            for line in f:
+                try:
+                    record = JSON_DECODER.decode(line.decode("utf-8"))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    # Partial line left by an interrupted write
+                    continue
+                file_id = record.pop("file_id", None)
+                if file_id:
+                    files[file_id] = record
+    except FileNotFoundError:
+        pass
+    except IOError as e:
+        print(f"[daemon] Warning: Could not replay state journal: {e}", file=sys.stderr)
+
+    # Migrate ISO last_processed timestamps written by older versions
+    for file_state in files.values():
+        legacy = file_state.pop("last_processed", None)
+        if legacy and "last_processed_ns" not in file_state:
+            try:
+                file_state["last_processed_ns"] = int(datetime.fromisoformat(legacy).timestamp() * 1e9)
+            except (ValueError, TypeError):
+                pass
+
+    return state
 
 
 def save_state(state: dict) -> None:
-    """Save the processing state to disk."""
+    """Write the full processing state to disk and clear the journal."""
     try:
         STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(STATE_FILE, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        tmp_file = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write(JSON_ENCODER.encode(state))
+        os.replace(tmp_file, STATE_FILE)
+        STATE_JOURNAL_FILE.unlink(missing_ok=True)
     except IOError as e:
         print(f"[daemon] Warning: Could not save state: {e}", file=sys.stderr)
 
 
+def journal_state(state: dict, file_id: str) -> None:
+    """Append one file's state to the journal, compacting once it grows large."""
+    record = {"file_id": file_id, **state["files"][file_id]}
+    try:
+        with open(STATE_JOURNAL_FILE, "ab") as f:
+            f.write(JSON_ENCODER.encode(record).encode("utf-8") + b"\n")
+            journal_size = f.tell()
+    except IOError as e:
+        print(f"[daemon] Warning: Could not write state journal: {e}", file=sys.stderr)
+        return
+
+    if journal_size > STATE_JOURNAL_MAX_BYTES:
+        save_state(state)
+
+
 def should_skip_message(role: str, content: str) -> bool:
     """Check if a message should be skipped."""
     # Skip non-user/assistant roles
@@ -124,11 +211,7 @@ def should_skip_message(role: str, content: str) -> bool:
         return True
 
     # Skip messages matching skip patterns
-    for pattern in SKIP_PATTERNS:
-        if pattern in content:
-            return True
-
-    return False
+    return SKIP_RE.search(content) is not None
 
 
 def truncate_message(content: str, max_length: int = MAX_MESSAGE_LENGTH) -> str:
@@ -141,32 +224,29 @@ def truncate_message(content: str, max_length: int = MAX_MESSAGE_LENGTH) -> str:
 def parse_timestamp(ts_str: str) -> Optional[datetime]:
     """Parse ISO timestamp string to datetime."""
     try:
-        # Handle ISO format with Z or +00:00
-        normalized = ts_str.replace("Z", "+00:00")
-        parsed = datetime.fromisoformat(normalized)
+        # Older Pythons need the Z suffix spelled as +00:00
+        if not ISO_Z_SUPPORTED and ts_str.endswith("Z"):
+            ts_str = ts_str[:-1] + "+00:00"
+        parsed = datetime.fromisoformat(ts_str)
         return parsed.astimezone(LOCAL_TZ)
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, AttributeError):
         return None
 
 
 def extract_text_content(content: list) -> str:
-    """Extract text from content array."""
-    texts = []
-    for item in content:
-        if isinstance(item, dict):
-            if item.get("type") == "text" and "text" in item:
-                texts.append(item["text"])
-            elif item.get("type") == "thinking":
-                # Skip thinking blocks
-                continue
-    return "".join(texts)
+    """Extract text from content array, skipping thinking and tool blocks."""
+    return "".join(
+        item["text"]
+        for item in content
+        if isinstance(item, dict) and item.get("type") == "text" and "text" in item
+    )
 
 
-def process_message_line(line: str) -> Optional[dict]:
+def process_message_line(line: bytes) -> Optional[dict]:
     """Process a single JSONL line and return log entry if applicable."""
     try:
-        data = json.loads(line)
-    except json.JSONDecodeError:
+        data = JSON_DECODER.decode(line.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return None
 
     # Only process message types
@@ -193,8 +273,9 @@ def process_message_line(line: str) -> Optional[dict]:
     if not parsed_ts:
         parsed_ts = datetime.now(LOCAL_TZ)
 
-    # Truncate long messages
-    content = truncate_message(content)
+    # Truncate long messages (rare, so check inline before calling out)
+    if len(content) > MAX_MESSAGE_LENGTH:
+        content = truncate_message(content)
 
     # Map role to display name
     role_label = "User" if role == "user" else "TARS"
@@ -206,30 +287,63 @@ def process_message_line(line: str) -> Optional[dict]:
     }
 
 
-def write_log_entry(entry: dict) -> None:
-    """Write a log entry to the appropriate daily file."""
+def format_log_entry(entry: dict) -> tuple[Path, bytes]:
+    """Return the daily file for a log entry and its encoded markdown."""
     ts = entry["timestamp"]
     role = entry["role"]
     content = entry["content"]
 
-    CONVERSATIONS_DIR.mkdir(parents=True, exist_ok=True)
+    day = ts.date()
+    target = _daily_target_cache.get(day)
+    if target is None:
+        target = _daily_target_cache[day] = CONVERSATIONS_DIR / f"{day:%Y-%m-%d}.md"
 
-    target = CONVERSATIONS_DIR / f"{ts:%Y-%m-%d}.md"
     log_line = f"## {ts:%H:%M} - [{role}]\n{content}\n\n"
+    return target, log_line.encode("utf-8")
 
-    # Check if we need a leading newline
-    needs_leading_newline = False
-    if target.exists() and target.stat().st_size > 0:
-        with open(target, "rb") as f:
-            f.seek(-1, 2)
-            needs_leading_newline = f.read(1) != b"\n"
-
-    with open(target, "a", encoding="utf-8") as f:
-        if needs_leading_newline:
-            f.write("\n")
-        f.write(log_line)
 
-    print(f"[daemon] Logged to {target.name}: {role} at {ts:%H:%M}")
+def needs_leading_newline(target: Path) -> bool:
+    """Check whether an existing, non-empty file lacks a trailing newline."""
+    try:
+        fd = os.open(target, os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    try:
+        size = os.fstat(fd).st_size
+        return size > 0 and os.pread(fd, 1, size - 1) != b"\n"
+    finally:
+        os.close(fd)
+
+
+def write_log_entries(target: Path, log_lines: list[bytes]) -> None:
+    """Append a batch of encoded log entries to a daily file in one write."""
+    global _conversations_dir_ready
+    if not _conversations_dir_ready:
+        CONVERSATIONS_DIR.mkdir(parents=True, exist_ok=True)
+        _conversations_dir_ready = True
+
+    # Check if we need a leading newline. Entries always end in a newline,
+    # so only the first write to each file needs to look at its last byte.
+    if target not in _newline_checked_targets:
+        if needs_leading_newline(target):
+            log_lines = [b"\n", *log_lines]
+        _newline_checked_targets.add(target)
+
+    # Bypass Python's buffered IO: the batch is already encoded, so append it
+    # with a raw O_APPEND write
+    data = memoryview(b"".join(log_lines))
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+    try:
+        fd = os.open(target, flags, 0o644)
+    except FileNotFoundError:
+        # CONVERSATIONS_DIR was removed while running; recreate it and retry
+        CONVERSATIONS_DIR.mkdir(parents=True, exist_ok=True)
+        fd = os.open(target, flags, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def get_file_id(filepath: Path) -> str:
@@ -237,16 +351,35 @@ def get_file_id(filepath: Path) -> str:
     return filepath.stem  # Returns filename without extension
 
 
-def process_file(filepath: Path, state: dict) -> int:
-    """Process new lines from a file. Returns number of entries written."""
+def stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it does not exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def process_file(
+    filepath: Path,
+    state: dict,
+    st: Optional[os.stat_result] = None,
+    fh: Optional[BinaryIO] = None,
+) -> int:
+    """Process new lines from a file. Returns number of entries written.
+
+    Pass the caller's stat result as `st` to avoid statting the file again,
+    and an already open binary handle as `fh` to avoid reopening it.
+    """
     file_id = get_file_id(filepath)
     file_state = state["files"].get(file_id, {"offset": 0})
     last_offset = file_state.get("offset", 0)
 
-    if not filepath.exists():
+    if st is None:
+        st = stat_or_none(filepath)
+    if st is None:
         return 0
 
-    current_size = filepath.stat().st_size
+    current_size = st.st_size
 
     # If file shrank, reset offset
     if current_size < last_offset:
@@ -255,50 +388,257 @@ def process_file(filepath: Path, state: dict) -> int:
     if current_size == last_offset:
         return 0
 
-    entries_written = 0
-
-    with open(filepath, "r", encoding="utf-8") as f:
-        # Seek to last processed position
-        f.seek(last_offset)
+    if fh is None:
+        with open(filepath, "rb", buffering=0) as f:
+            return process_file(filepath, state, st, f)
 
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+    entries_written = 0
+    entries_by_day: dict[Path, list[bytes]] = {}
 
-            entry = process_message_line(line)
-            if entry:
-                write_log_entry(entry)
-                entries_written += 1
+    # Seek to last processed position
+    fh.seek(last_offset)
+    new_offset = last_offset
 
-        # Update offset
-        new_offset = f.tell()
+    # Read into the shared buffer and only consume complete lines; a partially
+    # written last line stays unread until the next pass
+    buf = _read_buf
+    filled = 0
+    while True:
+        if filled == len(buf):
+            # A single line is larger than the buffer
+            buf.extend(bytes(len(buf)))
+        n = fh.readinto(memoryview(buf)[filled:])
+        if not n:
+            break
+        filled += n
+
+        start = 0
+        while True:
+            end = buf.find(b"\n", start, filled)
+            if end == -1:
+                break
+
+            # Most lines are tool calls, tool results and other events; skip
+            # them without copying, decoding or parsing
+            if MESSAGE_TYPE_RE.search(buf, start, end) and MESSAGE_ROLE_RE.search(buf, start, end):
+                entry = process_message_line(bytes(memoryview(buf)[start:end]))
+                if entry:
+                    target, log_line = format_log_entry(entry)
+                    entries_by_day.setdefault(target, []).append(log_line)
+                    entries_written += 1
+            start = end + 1
+
+        # Move the incomplete last line to the front of the buffer
+        new_offset += start
+        filled -= start
+        if start and filled:
+            buf[:filled] = buf[start:start + filled]
+
+    # Don't keep memory from an oversized line for the life of the daemon
+    if len(buf) > READ_BUFFER_SIZE:
+        del buf[READ_BUFFER_SIZE:]
+
+    for target, log_lines in entries_by_day.items():
+        write_log_entries(target, log_lines)
+
+    # One summary line per pass rather than one per entry
+    if entries_written:
+        print(f"[daemon] Logged {entries_written} entries to {', '.join(t.name for t in entries_by_day)}")
 
     # Update state using file_id (UUID) as key
     state["files"][file_id] = {
         "offset": new_offset,
-        "last_processed": datetime.now(LOCAL_TZ).isoformat(),
+        "last_processed_ns": time.time_ns(),
     }
 
     return entries_written
 
 
+@dataclass
+class SessionContext:
+    """A watched session file, kept open across checks."""
+
+    path: Path
+    file_id: str
+    fh: Optional[BinaryIO] = None
+    ino: Optional[int] = None
+    last_size: int = 0
+
+    def handle(self, st: os.stat_result) -> BinaryIO:
+        """Return the open handle, reopening it if the path now names a new file."""
+        if self.fh is None or self.ino != st.st_ino:
+            self.close()
+            self.fh = open(self.path, "rb", buffering=0)
+            self.ino = st.st_ino
+        return self.fh
+
+    def close(self) -> None:
+        if self.fh is not None:
+            self.fh.close()
+            self.fh = None
+
+
+def process_session(session: SessionContext, state: dict) -> int:
+    """Process a watched session if it grew. Returns number of entries written."""
+    st = stat_or_none(session.path)
+    if st is None:
+        return 0
+
+    if st.st_size < session.last_size:
+        # File was truncated or rotated
+        print("[daemon] File size decreased, resetting offset")
+        state["files"][session.file_id] = {"offset": 0}
+        session.last_size = 0
+
+    if st.st_size == session.last_size:
+        return 0
+
+    entries = process_file(session.path, state, st, session.handle(st))
+    session.last_size = st.st_size
+    if entries > 0:
+        journal_state(state, session.file_id)
+    return entries
+
+
+class SessionWatcher:
+    """Block until the sessions directory or one of the watched files changes.
+
+    Uses kqueue vnode events where available (macOS/BSD) so the daemon sleeps
+    until something is actually written. Elsewhere, or with watch mode "poll",
+    it falls back to sleeping POLL_INTERVAL_SECONDS between checks.
+    """
+
+    VNODE_EVENTS = (
+        getattr(select, "KQ_NOTE_WRITE", 0)
+        | getattr(select, "KQ_NOTE_EXTEND", 0)
+        | getattr(select, "KQ_NOTE_DELETE", 0)
+        | getattr(select, "KQ_NOTE_RENAME", 0)
+    )
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.fds: dict[Path, int] = {}
+        self.kq = None
+        if WATCH_MODE != "poll" and hasattr(select, "kqueue"):
+            self.kq = select.kqueue()
+
+    @property
+    def mode(self) -> str:
+        return "kqueue" if self.kq is not None else "poll"
+
+    def watch(self, *paths: Path) -> None:
+        """Watch the given files (plus the directory), dropping stale watches."""
+        if self.kq is None:
+            return
+
+        wanted = {self.directory, *paths}
+        for path in list(self.fds):
+            if path not in wanted:
+                os.close(self.fds.pop(path))
+
+        for path in wanted:
+            if path in self.fds:
+                continue
+            try:
+                fd = os.open(path, getattr(os, "O_EVTONLY", os.O_RDONLY))
+            except OSError:
+                continue
+            self.fds[path] = fd
+            event = select.kevent(
+                fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=self.VNODE_EVENTS,
+            )
+            self.kq.control([event], 0, 0)
+
+    def wait(self) -> None:
+        """Wait for a change event (or the timeout) before the next check."""
+        if self.kq is None:
+            time.sleep(POLL_INTERVAL_SECONDS)
+            return
+
+        events = self.kq.control(None, 16, WATCH_TIMEOUT_SECONDS)
+        paths_by_fd = {fd: path for path, fd in self.fds.items()}
+        for event in events:
+            # Deleted or replaced files must be reopened to keep receiving events
+            if event.fflags & (select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME):
+                path = paths_by_fd.get(event.ident)
+                if path is not None and path in self.fds:
+                    os.close(self.fds.pop(path))
+
+    def close(self) -> None:
+        for fd in self.fds.values():
+            os.close(fd)
+        self.fds.clear()
+        if self.kq is not None:
+            self.kq.close()
+
+
+def read_main_session_id() -> Optional[str]:
+    """Read the main session ID from sessions.json, reparsing only when it changes."""
+    sessions_json = SESSIONS_DIR / "sessions.json"
+    try:
+        st = sessions_json.stat()
+    except FileNotFoundError:
+        return None
+
+    if st.st_mtime_ns == _sessions_cache["mtime_ns"] and st.st_size == _sessions_cache["size"]:
+        return _sessions_cache["session_id"]
+
+    session_id = None
+    try:
+        with open(sessions_json, "r", encoding="utf-8") as f:
+            data = JSON_DECODER.decode(f.read())
+        # Look for agent:main:main key
+        main_entry = data.get("agent:main:main", {})
+        session_id = main_entry.get("sessionId")
+    except (json.JSONDecodeError, IOError):
+        pass
+
+    _sessions_cache.update(mtime_ns=st.st_mtime_ns, size=st.st_size, session_id=session_id)
+    return session_id
+
+
+def find_latest_session_file() -> Optional[Path]:
+    """Find the most recently modified session file.
+
+    The scan is reused until SESSIONS_DIR's own mtime changes, i.e. until a
+    session file is created, removed or renamed.
+    """
+    try:
+        dir_mtime_ns = SESSIONS_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if dir_mtime_ns == _latest_session_cache["dir_mtime_ns"]:
+        return _latest_session_cache["path"]
+
+    latest_path = None
+    latest_mtime_ns = -1
+    with os.scandir(SESSIONS_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".jsonl") or ".deleted." in entry.name:
+                continue
+            try:
+                mtime_ns = entry.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if mtime_ns > latest_mtime_ns:
+                latest_path = Path(entry.path)
+                latest_mtime_ns = mtime_ns
+
+    _latest_session_cache.update(dir_mtime_ns=dir_mtime_ns, path=latest_path)
+    return latest_path
+
+
 def get_main_session_file() -> Optional[Path]:
     """Get the path to the main session file by reading sessions.json dynamically."""
-    sessions_json = SESSIONS_DIR / "sessions.json"
-    if sessions_json.exists():
-        try:
-            with open(sessions_json, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            # Look for agent:main:main key
-            main_entry = data.get("agent:main:main", {})
-            session_id = main_entry.get("sessionId")
-            if session_id:
-                main_file = SESSIONS_DIR / f"{session_id}.jsonl"
-                if main_file.exists():
-                    return main_file
-        except (json.JSONDecodeError, IOError):
-            pass
+    session_id = read_main_session_id()
+    if session_id:
+        main_file = SESSIONS_DIR / f"{session_id}.jsonl"
+        if main_file.exists():
+            return main_file
 
     # Fallback: use explicit session ID if provided
     if MAIN_SESSION_ID:
@@ -307,11 +647,7 @@ def get_main_session_file() -> Optional[Path]:
             return main_file
 
     # Last fallback: most recently modified jsonl file
-    jsonl_files = [p for p in SESSIONS_DIR.glob("*.jsonl") if ".deleted." not in p.name]
-    if not jsonl_files:
-        return None
-
-    return max(jsonl_files, key=lambda p: p.stat().st_mtime)
+    return find_latest_session_file()
 
 
 def run_daemon():
@@ -320,7 +656,11 @@ def run_daemon():
     print(f"[daemon] Sessions dir: {SESSIONS_DIR}")
     print(f"[daemon] Conversations dir: {CONVERSATIONS_DIR}")
     print(f"[daemon] State file: {STATE_FILE}")
-    print(f"[daemon] Poll interval: {POLL_INTERVAL_SECONDS}s")
+    watcher = SessionWatcher(SESSIONS_DIR)
+    if watcher.mode == "kqueue":
+        print(f"[daemon] Watch mode: kqueue (recheck every {WATCH_TIMEOUT_SECONDS}s)")
+    else:
+        print(f"[daemon] Watch mode: poll ({POLL_INTERVAL_SECONDS}s)")
 
     # Ensure directories exist
     CONVERSATIONS_DIR.mkdir(parents=True, exist_ok=True)
@@ -338,54 +678,34 @@ def run_daemon():
     print(f"[daemon] Watching main session: {main_file.name}")
 
     # Process existing content on startup (but only new lines based on state)
-    entries = process_file(main_file, state)
-    if entries > 0:
-        print(f"[daemon] Wrote {entries} entries from existing file")
+    session = SessionContext(main_file, get_file_id(main_file))
+    process_session(session, state)
     save_state(state)
 
-    # Watch for changes
-    last_size = main_file.stat().st_size
-    last_file_id = get_file_id(main_file)
-
     print("[daemon] Entering watch loop...")
     while True:
         try:
-            time.sleep(POLL_INTERVAL_SECONDS)
+            watcher.watch(session.path, SESSIONS_DIR / "sessions.json")
+            watcher.wait()
 
             # Check if main session file changed (new session)
             current_main = get_main_session_file()
             if not current_main:
                 continue
 
-            current_file_id = get_file_id(current_main)
-
-            # If session changed, update to new file
-            if current_file_id != last_file_id:
+            # If session changed, switch to the new file and process it right away
+            if get_file_id(current_main) != session.file_id:
                 print(f"[daemon] Session changed: {current_main.name}")
-                main_file = current_main
-                last_file_id = current_file_id
-                last_size = 0
-                continue
-
-            if not main_file.exists():
-                continue
-
-            current_size = main_file.stat().st_size
+                session.close()
+                session = SessionContext(current_main, get_file_id(current_main))
 
-            if current_size > last_size:
-                entries = process_file(main_file, state)
-                if entries > 0:
-                    save_state(state)
-                last_size = current_size
-            elif current_size < last_size:
-                # File was truncated or rotated
-                print("[daemon] File size decreased, resetting offset")
-                state["files"][get_file_id(main_file)] = {"offset": 0}
-                last_size = 0
+            process_session(session, state)
 
         except KeyboardInterrupt:
             print("\n[daemon] Interrupted, saving state...")
             save_state(state)
+            session.close()
+            watcher.close()
             break
         except Exception as e:
             print(f"[daemon] Error: {e}", file=sys.stderr)